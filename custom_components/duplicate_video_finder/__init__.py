@@ -4,13 +4,14 @@ from __future__ import annotations
 import logging
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall, callback
-from homeassistant.helpers import config_validation as cv
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.components.frontend import add_extra_js_url
 from homeassistant.const import Platform
 from homeassistant.helpers.entity_component import EntityComponent
 
@@ -20,6 +21,9 @@ from .sensor import DuplicateVideoFinderSensor
 
 _LOGGER = logging.getLogger(__name__)
 
+# Use a larger copy buffer (256 KiB) for the frontend asset copies
+shutil.COPY_BUFSIZE = max(getattr(shutil, "COPY_BUFSIZE", 0), 256 * 1024)
+
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.Schema({})
@@ -34,15 +38,10 @@ PANEL_TITLE = "Duplicate Videos"
 PANEL_ICON = "mdi:file-video"
 PANEL_NAME = "duplicate-video-finder"
 
-async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
-    """Set up the Duplicate Video Finder integration."""
-    # Initialize component data
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN]["duplicates"] = {}
-    hass.data[DOMAIN]["entities"] = []
-
-    # Initialize default scan state
-    hass.data[DOMAIN]["scan_state"] = {
+# Template for a fresh scan state; copy (and give found_duplicates its
+# own dict) before storing in hass.data
+_INITIAL_SCAN_STATE = MappingProxyType(
+    {
         "is_scanning": False,
         "is_paused": False,
         "cancel_requested": False,
@@ -54,45 +53,118 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         "total_pause_time": 0,
         "found_duplicates": {},
     }
-    
-    # Create local directory for frontend files
-    local_dir = hass.config.path("www", "duplicate_video_finder")
-    if not os.path.exists(local_dir):
-        os.makedirs(local_dir)
-    
-    # Copy frontend files to www directory
+)
+
+# Set once the frontend files have been copied, so config entry reloads
+# don't redo the filesystem work
+_FRONTEND_READY = False
+
+
+def _needs_copy(src: str, dst: str) -> bool:
+    """Check whether the frontend asset at dst is stale (two stat calls)."""
     try:
-        # Copy JS file
-        js_source = os.path.join(
-            os.path.dirname(__file__), "frontend", "duplicate-video-finder-panel.js"
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        return True
+    return (
+        src_stat.st_size != dst_stat.st_size
+        or src_stat.st_mtime_ns > dst_stat.st_mtime_ns
+    )
+
+
+def _lower_worker_priority() -> None:
+    """Lower the CPU priority of a scan worker thread.
+
+    nice() applies to the calling thread on Linux, which is exactly the
+    pool worker we want demoted. ionice via psutil is deliberately not
+    used here: ioprio_set(IOPRIO_WHO_PROCESS, pid) targets the thread
+    whose TID equals pid, i.e. HA's main thread, not this worker.
+    """
+    try:
+        os.nice(10)
+    except OSError:
+        pass
+
+
+def _install_frontend(src_dir: str, dst_dir: str) -> bool:
+    """Install frontend assets into the www directory.
+
+    Runs in the executor so the event loop pays a single thread-hop for
+    the mkdir, stat checks and copies combined. Returns True if anything
+    was copied.
+    """
+    os.makedirs(dst_dir, exist_ok=True)
+    copied = False
+    for name in ("duplicate-video-finder-panel.js",):
+        src = os.path.join(src_dir, name)
+        dst = os.path.join(dst_dir, name)
+        if _needs_copy(src, dst):
+            shutil.copyfile(src, dst)
+            copied = True
+    return copied
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Duplicate Video Finder integration."""
+    # Initialize component data in one shot; on re-setup reuse the
+    # existing dict so an in-flight scan's state isn't wiped
+    if hass.data.get(DOMAIN) is None:
+        hass.data[DOMAIN] = {
+            "duplicates": {},
+            "entities": set(),
+            "scan_state": {**_INITIAL_SCAN_STATE, "found_duplicates": {}},
+        }
+
+    # Integration-owned pool for scan I/O, so hashing doesn't compete
+    # with recorder/HTTP work in HA's shared default executor. Workers
+    # are deprioritized at the OS level so the kernel scheduler keeps
+    # them out of the way of foreground HA work
+    if "io_executor" not in hass.data[DOMAIN]:
+        hass.data[DOMAIN]["io_executor"] = ThreadPoolExecutor(
+            max_workers=min(8, (os.cpu_count() or 2) * 2),
+            thread_name_prefix="dvf_io",
+            initializer=_lower_worker_priority,
         )
-        js_dest = os.path.join(local_dir, "duplicate-video-finder-panel.js")
-        
-        # Copy files
-        await hass.async_add_executor_job(shutil.copy2, js_source, js_dest)
-        
-        _LOGGER.info("Frontend files copied to %s", local_dir)
-    except Exception as err:
-        _LOGGER.error("Error copying frontend files: %s", err)
+
+    # Copy frontend files to www directory (skipped on reloads)
+    global _FRONTEND_READY
+    local_dir = hass.config.path("www", "duplicate_video_finder")
+
+    if not _FRONTEND_READY:
+        try:
+            # One executor job covers the mkdir, stat checks and copies
+            copied = await hass.async_add_executor_job(
+                _install_frontend,
+                os.path.join(os.path.dirname(__file__), "frontend"),
+                local_dir,
+            )
+            if copied:
+                _LOGGER.info("Frontend files copied to %s", local_dir)
+
+            _FRONTEND_READY = True
+        except Exception as err:
+            _LOGGER.error("Error copying frontend files: %s", err)
     
-    # Register the panel
-    try:
-        # Register the panel directly
-        hass.components.frontend.async_register_built_in_panel(
+    # Register the panel (once per HA lifetime; re-registration raises)
+    if not hass.data[DOMAIN].get("_panel_registered"):
+        try:
+            # Register the panel directly
+            hass.components.frontend.async_register_built_in_panel(
             "custom",
             PANEL_TITLE,
             PANEL_ICON,
             PANEL_NAME,
-            {"_panel_custom": {
-                "name": "duplicate-video-finder-panel",
-                "module_url": "/local/duplicate_video_finder/duplicate-video-finder-panel.js",
-                "embed_iframe": False,
-            }},
-            require_admin=False,
-        )
-        _LOGGER.info("Panel registered successfully")
-    except Exception as err:
-        _LOGGER.error("Error registering panel: %s", err)
+                {"_panel_custom": {
+                    "name": "duplicate-video-finder-panel",
+                    "module_url": "/local/duplicate_video_finder/duplicate-video-finder-panel.js",
+                    "embed_iframe": False,
+                }},
+                require_admin=False,
+            )
+            hass.data[DOMAIN]["_panel_registered"] = True
+            _LOGGER.info("Panel registered successfully")
+        except Exception as err:
+            _LOGGER.error("Error registering panel: %s", err)
     
     # Set up services
     await async_setup_services(hass)
@@ -141,12 +213,16 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Unload sensor platform
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
-    # Remove services
-    for service in hass.services.async_services().get(DOMAIN, {}):
+    # Remove services (domain-scoped lookup avoids snapshotting every
+    # registered service in the instance)
+    for service in list(hass.services.async_services_for_domain(DOMAIN)):
         hass.services.async_remove(DOMAIN, service)
     
     # Clean up data
     if DOMAIN in hass.data:
+        io_executor = hass.data[DOMAIN].get("io_executor")
+        if io_executor is not None:
+            io_executor.shutdown(wait=False)
         hass.data.pop(DOMAIN)
     
     return unload_ok 
\ No newline at end of file
@@ -27,6 +27,10 @@ DEFAULT_VIDEO_EXTENSIONS: Final = [
     ".flv",
     ".webm",
 ]
+# Frozenset (lowercase) for O(1) membership tests in the scan hot path
+DEFAULT_VIDEO_EXTENSIONS_SET: Final = frozenset(
+    ext.lower() for ext in DEFAULT_VIDEO_EXTENSIONS
+)
 DEFAULT_MAX_CPU_PERCENT: Final = 70  # Default maximum CPU usage percentage
 DEFAULT_BATCH_SIZE: Final = 100  # Default number of files to process in a batch
 
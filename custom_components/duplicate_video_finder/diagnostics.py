@@ -1,15 +1,49 @@
 """Diagnostics for Duplicate Video Finder."""
+import functools
 import os
 import logging
 import json
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
-from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.config_entries import ConfigEntry
 
 _LOGGER = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=4)
+def _load_manifest(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Load manifest.json, cached by path and mtime."""
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _read_manifest(path: str) -> Dict[str, Any]:
+    """Stat and load a manifest in one blocking call (run in executor)."""
+    return _load_manifest(path, os.stat(path).st_mtime_ns)
+
+
+def _probe(paths: list) -> Dict[str, bool]:
+    """Check existence of several paths in one executor job.
+
+    Paths sharing a parent are resolved with a single os.scandir pass of
+    that directory instead of one stat call per file.
+    """
+    by_parent: Dict[str, list] = {}
+    for path in paths:
+        by_parent.setdefault(os.path.dirname(path), []).append(path)
+
+    probes: Dict[str, bool] = {}
+    for parent, children in by_parent.items():
+        try:
+            names = {entry.name for entry in os.scandir(parent)}
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            names = set()
+        for path in children:
+            probes[path] = os.path.basename(path) in names
+    return probes
+
+
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> Dict[str, Any]:
@@ -27,33 +61,39 @@ async def async_get_config_entry_diagnostics(
     services = hass.services.async_services()
     service_registered = "duplicate_video_finder" in services and "find_duplicates" in services.get("duplicate_video_finder", {})
     
-    # Check if the frontend files exist
+    # Check if the frontend and component files exist; batch all the
+    # stat calls into a single executor job instead of blocking the
+    # event loop once per path
     www_dir = hass.config.path("www", "duplicate_video_finder")
     html_file = os.path.join(www_dir, "duplicate-video-finder-panel.html")
     js_file = os.path.join(www_dir, "duplicate-video-finder-panel.js")
-    
-    frontend_files_exist = os.path.exists(html_file) and os.path.exists(js_file)
-    
-    # Check component files
+
     component_dir = os.path.dirname(__file__)
     manifest_file = os.path.join(component_dir, "manifest.json")
     init_file = os.path.join(component_dir, "__init__.py")
     services_file = os.path.join(component_dir, "services.py")
-    
+
+    probes = await hass.async_add_executor_job(
+        _probe,
+        [www_dir, html_file, js_file, manifest_file, init_file, services_file],
+    )
+
+    frontend_files_exist = probes[html_file] and probes[js_file]
     component_files_exist = (
-        os.path.exists(manifest_file) 
-        and os.path.exists(init_file) 
-        and os.path.exists(services_file)
+        probes[manifest_file] and probes[init_file] and probes[services_file]
     )
     
-    # Get manifest content
+    # Get manifest content (cached across diagnostics calls by mtime);
+    # the stat and the cache-miss read both happen off the event loop
     manifest_content = {}
-    if os.path.exists(manifest_file):
-        try:
-            with open(manifest_file, "r") as f:
-                manifest_content = json.load(f)
-        except Exception as err:
-            _LOGGER.error("Error reading manifest.json: %s", err)
+    try:
+        manifest_content = await hass.async_add_executor_job(
+            _read_manifest, manifest_file
+        )
+    except FileNotFoundError:
+        pass
+    except Exception as err:
+        _LOGGER.error("Error reading manifest.json: %s", err)
     
     # Create diagnostics report
     diagnostics = {
@@ -64,9 +104,9 @@ async def async_get_config_entry_diagnostics(
         "component_files_exist": component_files_exist,
         "panels": panels,
         "manifest": manifest_content,
-        "www_dir_exists": os.path.exists(www_dir),
-        "html_file_exists": os.path.exists(html_file),
-        "js_file_exists": os.path.exists(js_file),
+        "www_dir_exists": probes[www_dir],
+        "html_file_exists": probes[html_file],
+        "js_file_exists": probes[js_file],
     }
     
     _LOGGER.info("Diagnostics generated: %s", diagnostics)
@@ -18,6 +18,7 @@ customElements.define(
       this._progress = 0;
       this._currentFile = "";
       this._duplicates = null;
+      this._duplicateGroupCount = undefined;
       this._stateInitialized = false;
       this._scanStarted = false;
       this._startTime = null;
@@ -101,8 +102,15 @@ customElements.define(
         this._progress = newProgress;
         this._currentFile = newCurrentFile;
         
-        // Update duplicates if available
-        if (attributes.found_duplicates) {
+        // Update duplicates if available. New backends only report a
+        // group count and serve the full dict over the WebSocket; old
+        // ones still embed found_duplicates in the attributes.
+        if (attributes.duplicate_group_count !== undefined) {
+          if (attributes.duplicate_group_count !== this._duplicateGroupCount) {
+            this._duplicateGroupCount = attributes.duplicate_group_count;
+            this._fetchDuplicates();
+          }
+        } else if (attributes.found_duplicates) {
           this._duplicates = attributes.found_duplicates;
         }
       } else {
@@ -178,6 +186,19 @@ customElements.define(
       );
     }
     
+    _fetchDuplicates() {
+      if (!this._hass) return;
+      this._hass
+        .callWS({ type: 'duplicate_video_finder/list_duplicates' })
+        .then((duplicates) => {
+          this._duplicates = duplicates || {};
+          this.render();
+        })
+        .catch((err) => {
+          console.error('Error fetching duplicates:', err);
+        });
+    }
+
     // Helper methods to extract attributes consistently
     _getProgress(attributes) {
       return parseFloat(attributes.progress || attributes.scan_progress || 
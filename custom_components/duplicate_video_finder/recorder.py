@@ -0,0 +1,14 @@
+"""Integration platform for recorder."""
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant, callback
+
+
+@callback
+def exclude_attributes(hass: HomeAssistant) -> set[str]:
+    """Exclude ephemeral scan attributes from being recorded.
+
+    current_file changes per hashed file and found_duplicates can be a
+    very large dict; recording them balloons the database during scans.
+    """
+    return {"current_file", "found_duplicates"}
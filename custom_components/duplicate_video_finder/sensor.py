@@ -29,7 +29,8 @@ async def async_setup_entry(
     if hass.states.get(SCAN_STATE_ENTITY_ID) is None:
         _LOGGER.info("Creating new sensor entity")
         sensor = DuplicateVideoFinderSensor(hass)
-        async_add_entities([sensor], True)
+        # No update_before_add: the sensor has no external source to poll
+        async_add_entities([sensor], False)
     else:
         _LOGGER.info("Sensor entity already exists")
 
@@ -37,6 +38,8 @@ async def async_setup_entry(
 class DuplicateVideoFinderSensor(SensorEntity):
     """Sensor for tracking duplicate video scan state."""
 
+    _attr_should_poll = False
+
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the sensor."""
         self.hass = hass
@@ -48,8 +51,10 @@ class DuplicateVideoFinderSensor(SensorEntity):
             "current_file": "",
             "total_files": 0,
             "processed_files": 0,
-            "found_duplicates": {},
+            "duplicate_group_count": 0,
+            "duplicate_file_count": 0,
         }
+        self._last_snapshot = None
         _LOGGER.info("Initializing %s", self.entity_id)
 
     async def async_added_to_hass(self) -> None:
@@ -62,7 +67,7 @@ class DuplicateVideoFinderSensor(SensorEntity):
         )
         
         # Read current scan state from hass.data
-        await self._update_from_data()
+        self._update_from_data()
         
         # Immediately write state to make sure it's not unavailable
         self.async_write_ha_state()
@@ -72,10 +77,16 @@ class DuplicateVideoFinderSensor(SensorEntity):
     def _update_callback(self) -> None:
         """Update the entity when scan state changes."""
         _LOGGER.debug("Received scan state update")
-        self.hass.async_create_task(self._update_from_data())
+        self._update_from_data()
+
+    @callback
+    def _update_from_data(self) -> None:
+        """Update state and attributes from hass.data.
 
-    async def _update_from_data(self) -> None:
-        """Update state and attributes from hass.data."""
+        Synchronous on purpose: it only touches hass.data and writes
+        state, so spawning a task per dispatcher signal would just add a
+        scheduler round-trip.
+        """
         if DOMAIN not in self.hass.data:
             _LOGGER.warning("Domain data not found, using defaults")
             self._state = STATE_IDLE
@@ -97,14 +108,38 @@ class DuplicateVideoFinderSensor(SensorEntity):
         processed = scan_state.get("processed_files", 0)
         total = max(scan_state.get("total_files", 1), 1)
         progress = round((processed / total) * 100, 1) if total > 0 else 0
-            
-        # Update attributes
+
+        # Only counts are exposed as attributes; the full
+        # found_duplicates dict can be megabytes and is served on demand
+        # via the list_duplicates WebSocket command instead
+        found_duplicates = scan_state.get("found_duplicates", {})
+        group_count = len(found_duplicates)
+        file_count = sum(len(group) for group in found_duplicates.values())
+
+        # Skip the state write entirely if nothing visible changed; a fast
+        # scan can otherwise flood the state machine with identical writes.
+        # Progress is quantized to whole percent so sub-percent movement
+        # alone doesn't count as a change. The duplicate counts are part
+        # of the snapshot so a results-only update still writes state
+        # (and lets the panel notice it should refetch).
+        snapshot = (
+            self._state,
+            int(progress),
+            scan_state.get("current_file", ""),
+            group_count,
+            file_count,
+        )
+        if snapshot == self._last_snapshot:
+            return
+        self._last_snapshot = snapshot
+
         self._attrs = {
             "progress": progress,
             "current_file": scan_state.get("current_file", ""),
             "total_files": total,
             "processed_files": processed,
-            "found_duplicates": scan_state.get("found_duplicates", {}),
+            "duplicate_group_count": group_count,
+            "duplicate_file_count": file_count,
             "friendly_name": self._name,
         }
         
@@ -4,18 +4,31 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import logging
+import mmap
 import os
+import threading
 import time
 import glob
-import threading
-from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Set, Tuple, Optional
-from pathlib import Path
 import shutil
 
+import voluptuous as vol
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+from homeassistant.components import websocket_api
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
 
 from .const import (
     CONF_VIDEO_EXTENSIONS,
@@ -71,8 +84,16 @@ EXCLUDED_DIRS: Set[str] = {
     "/.thunderbird",
 }
 
-# Maximum number of worker threads for file hashing
-MAX_WORKERS = 4
+# Duplicate detection only needs protection against accidental
+# collisions, so prefer a fast content fingerprint: xxh3, then the
+# SIMD-accelerated blake3, and only then SHA-256 (multi-GB/s for the
+# first two vs ~500 MB/s for software SHA-256)
+if xxhash is not None:
+    _new_hasher = xxhash.xxh3_128
+elif blake3 is not None:
+    _new_hasher = blake3.blake3
+else:
+    _new_hasher = hashlib.sha256
 
 # Initialize the scan state once
 scan_state = {
@@ -89,22 +110,45 @@ scan_state = {
     "pause_event": None,  # Will be initialized in async_setup_services
 }
 
+# Minimum interval between dispatched state updates during a scan, so a
+# fast scan can't flood the event bus with per-file updates
+_DISPATCH_INTERVAL = 0.25
+_last_dispatch = 0.0
+
+# Guards processed_files increments from concurrent hash workers; int +=
+# is not atomic across the read/add/store sequence
+_progress_lock = threading.Lock()
+
+# Keys whose change always dispatches immediately (scan lifecycle)
+_LIFECYCLE_KEYS = ("is_scanning", "is_paused", "cancel_requested", "found_duplicates")
+
 @callback
 def update_scan_state(hass: HomeAssistant, **kwargs) -> None:
-    """Update scan state and notify listeners."""
-    # Update scan state with provided values
+    """Update scan state and notify listeners (throttled during scans)."""
+    global _last_dispatch
+
+    # Update scan state with provided values. scan_state is stored in
+    # hass.data once by async_setup_services and mutated in place here,
+    # so no per-call hass.data membership test or re-store is needed
     for key, value in kwargs.items():
         if key in scan_state:
             scan_state[key] = value
-    
-    # Store in hass.data for access by frontend
-    if DOMAIN in hass.data:
-        hass.data[DOMAIN]["scan_state"] = scan_state
-    
+
+    # Progress-only updates are throttled to ~4/sec; lifecycle changes
+    # (start/pause/cancel/results) always go out immediately
+    now = time.monotonic()
+    if (
+        not any(key in kwargs for key in _LIFECYCLE_KEYS)
+        and scan_state.get("is_scanning", False)
+        and now - _last_dispatch < _DISPATCH_INTERVAL
+    ):
+        return
+    _last_dispatch = now
+
     # Log for debugging
-    _LOGGER.debug("Scan state updated: %s", {k: v for k, v in scan_state.items() 
+    _LOGGER.debug("Scan state updated: %s", {k: v for k, v in scan_state.items()
                                             if k != 'found_duplicates'})
-    
+
     # Force a state update regardless of entity status
     entity_state_name = "scanning"
     if not scan_state.get("is_scanning", False):
@@ -133,55 +177,122 @@ def update_scan_state(hass: HomeAssistant, **kwargs) -> None:
     # Notify listeners for components using dispatcher
     async_dispatcher_send(hass, SCAN_STATE_UPDATED)
 
-def calculate_file_hash(filepath: str, chunk_size: int = 8192) -> str:
-    """Calculate SHA-256 hash of a file."""
+# Files at least this large are hashed through mmap instead of readv
+MMAP_THRESHOLD = 16 << 20
+
+def _wait_if_paused() -> bool:
+    """Handle a pause/cancel request between chunks.
+
+    Returns True when the scan was cancelled and hashing should stop.
+    """
+    if scan_state["cancel_requested"]:
+        return True
+
+    if scan_state["is_paused"]:
+        # Wait until resumed
+        scan_state["pause_event"].clear()
+        scan_state["pause_time"] = time.time()
+        scan_state["pause_event"].wait()
+        # Calculate pause duration
+        if scan_state["pause_time"]:
+            scan_state["total_pause_time"] += time.time() - scan_state["pause_time"]
+            scan_state["pause_time"] = None
+
+    return False
+
+def calculate_file_hash(filepath: str, chunk_size: int = 1 << 20) -> str:
+    """Calculate a content hash of a file (xxh3 when available)."""
     try:
         # Update current file in scan state
         scan_state["current_file"] = filepath
-        
-        sha256_hash = hashlib.sha256()
+
+        file_hasher = _new_hasher()
+
+        # Raw fd reads skip Python's buffered-I/O layer (pointless with
+        # 1 MiB chunks); fadvise tells the kernel to read ahead and then
+        # drop our pages so a scan doesn't evict the rest of HA's cache
+        fd = os.open(filepath, os.O_RDONLY)
+        try:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+            file_size = os.fstat(fd).st_size
+            if file_size >= MMAP_THRESHOLD:
+                # Large files: map the file and hash 4 MiB windows
+                # straight from the page cache, skipping the copy into
+                # a read buffer entirely
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                    if hasattr(mapped, "madvise"):
+                        mapped.madvise(mmap.MADV_SEQUENTIAL)
+                    with memoryview(mapped) as view:
+                        for offset in range(0, file_size, 4 << 20):
+                            if _wait_if_paused():
+                                return ""
+                            file_hasher.update(view[offset:offset + (4 << 20)])
+            else:
+                # One preallocated buffer serves the whole file; readv
+                # fills it in place so there's no allocation per chunk
+                buf = bytearray(chunk_size)
+                view = memoryview(buf)
+
+                while read_size := os.readv(fd, (buf,)):
+                    if _wait_if_paused():
+                        return ""
+                    file_hasher.update(view[:read_size])
+
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+        # Count completed files as an integer; progress percentage is
+        # derived on read, so no per-file float accumulation error
+        with _progress_lock:
+            scan_state["processed_files"] += 1
+
+        return file_hasher.hexdigest()
+    except (PermissionError, FileNotFoundError, OSError, ValueError) as err:
+        _LOGGER.debug("Error hashing file %s: %s", filepath, err)
+        # Count the file as processed even on error
+        with _progress_lock:
+            scan_state["processed_files"] += 1
+        return ""
+
+# Bytes hashed from each end of a file in the partial-hash prefilter
+PARTIAL_HASH_BYTES = 64 * 1024
+
+def calculate_partial_hash(filepath: str) -> str:
+    """Hash the first and last 64 KiB of a file as a cheap prefilter."""
+    try:
+        # Bail out promptly if the scan was cancelled
+        if scan_state["cancel_requested"]:
+            return ""
+
+        file_hasher = _new_hasher()
         file_size = os.path.getsize(filepath)
-        processed_size = 0
-        
+
         with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(chunk_size), b""):
-                # Check if pause or cancel was requested
-                if scan_state["cancel_requested"]:
-                    return ""
-                
-                if scan_state["is_paused"]:
-                    # Wait until resumed
-                    scan_state["pause_event"].clear()
-                    scan_state["pause_time"] = time.time()
-                    scan_state["pause_event"].wait()
-                    # Calculate pause duration
-                    if scan_state["pause_time"]:
-                        scan_state["total_pause_time"] += time.time() - scan_state["pause_time"]
-                        scan_state["pause_time"] = None
-                
-                sha256_hash.update(chunk)
-                processed_size += len(chunk)
-                
-                # Update progress
-                scan_state["processed_files"] = scan_state["processed_files"] + (processed_size / file_size) / scan_state["total_files"]
-        
-        # Increment processed files counter
-        scan_state["processed_files"] += 1 / scan_state["total_files"]
-        
-        return sha256_hash.hexdigest()
+            file_hasher.update(f.read(PARTIAL_HASH_BYTES))
+            if file_size > 2 * PARTIAL_HASH_BYTES:
+                f.seek(-PARTIAL_HASH_BYTES, os.SEEK_END)
+                file_hasher.update(f.read(PARTIAL_HASH_BYTES))
+
+        return file_hasher.hexdigest()
     except (PermissionError, FileNotFoundError, OSError) as err:
-        _LOGGER.debug("Error hashing file %s: %s", filepath, err)
-        # Increment processed files counter even on error
-        scan_state["processed_files"] += 1 / scan_state["total_files"]
+        _LOGGER.debug("Error partial-hashing file %s: %s", filepath, err)
         return ""
 
+# Precomputed tuple so the exclusion test is a single C-level
+# str.startswith call instead of a Python loop over the set
+EXCLUDED_PREFIXES: Tuple[str, ...] = tuple(EXCLUDED_DIRS)
+
 def is_excluded_directory(path: str) -> bool:
     """Check if a directory should be excluded from scanning."""
     # Convert to absolute path
     abs_path = os.path.abspath(path)
-    
+
     # Check if the path starts with any excluded directory
-    return any(abs_path.startswith(excluded) for excluded in EXCLUDED_DIRS)
+    return abs_path.startswith(EXCLUDED_PREFIXES)
 
 def get_home_directories() -> List[str]:
     """Get a list of all directories under /home."""
@@ -197,76 +308,148 @@ def get_home_directories() -> List[str]:
     
     return home_dirs
 
-def find_video_files(directory: str, video_extensions: List[str], hass: Optional[HomeAssistant] = None) -> List[str]:
-    """Find all video files in a directory and its subdirectories."""
+def find_video_files(
+    directory: str,
+    video_extensions: List[str],
+    hass: Optional[HomeAssistant] = None,
+) -> List[Tuple[str, int, int, float]]:
+    """Find all video files in a directory and its subdirectories.
+
+    Returns (path, size, mtime_ns, ctime) tuples; all stat fields come
+    from the scandir entry so the dedup prefilter, the hash cache and
+    the result grouping never have to re-stat the files.
+    """
     video_files = []
-    
-    try:
-        for root, dirs, files in os.walk(directory, topdown=True):
-            # Check if cancel was requested
-            if scan_state["cancel_requested"]:
-                return video_files
-                
-            # Check if pause was requested
-            if scan_state["is_paused"]:
-                # Wait until resumed
-                scan_state["pause_event"].clear()
-                scan_state["pause_time"] = time.time()
-                
-                # Update state for UI
-                if hass:
-                    hass.add_job(update_scan_state, hass, current_file=f"Paused at: {root}")
-                
-                scan_state["pause_event"].wait()
-                
-                # Calculate pause duration
-                if scan_state["pause_time"]:
-                    scan_state["total_pause_time"] += time.time() - scan_state["pause_time"]
-                    scan_state["pause_time"] = None
-            
-            # Modify dirs in-place to exclude directories we don't want to scan
-            dirs[:] = [d for d in dirs if not is_excluded_directory(os.path.join(root, d))]
-            
-            for filename in files:
-                if any(filename.lower().endswith(ext) for ext in video_extensions):
-                    filepath = os.path.join(root, filename)
-                    video_files.append(filepath)
-                    
-                    # Update current file for UI
-                    if hass and len(video_files) % 10 == 0:  # Update every 10 files to reduce overhead
-                        hass.add_job(update_scan_state, hass, current_file=filepath)
-    except (PermissionError, OSError) as err:
-        _LOGGER.warning("Error scanning directory %s: %s", directory, err)
-    
+    ext_set = frozenset(ext.lower() for ext in video_extensions)
+
+    # Explicit scandir-based traversal: entry types come from the
+    # directory read itself instead of a stat call per entry, and the
+    # roots are already absolute so no abspath is needed per directory
+    stack = [os.path.abspath(directory)]
+    while stack:
+        # Check if cancel was requested
+        if scan_state["cancel_requested"]:
+            return video_files
+
+        root = stack.pop()
+
+        # Check if pause was requested
+        if scan_state["is_paused"]:
+            # Wait until resumed
+            scan_state["pause_event"].clear()
+            scan_state["pause_time"] = time.time()
+
+            # Update state for UI
+            if hass:
+                hass.add_job(update_scan_state, hass, current_file=f"Paused at: {root}")
+
+            scan_state["pause_event"].wait()
+
+            # Calculate pause duration
+            if scan_state["pause_time"]:
+                scan_state["total_pause_time"] += time.time() - scan_state["pause_time"]
+                scan_state["pause_time"] = None
+
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Skip directories we don't want to scan
+                        if not entry.path.startswith(EXCLUDED_PREFIXES):
+                            stack.append(entry.path)
+                    # O(1) suffix lookup; only the extension is lowered,
+                    # not the whole filename
+                    elif (dot := entry.name.rfind(".")) >= 0 and entry.name[dot:].lower() in ext_set:
+                        try:
+                            # Follow symlinks here: hashing reads the
+                            # target's content, so the size/mtime used
+                            # for bucketing must be the target's too
+                            # (broken links raise OSError and are skipped)
+                            stat_result = entry.stat()
+                        except OSError as err:
+                            _LOGGER.debug("Error statting %s: %s", entry.path, err)
+                            continue
+                        video_files.append(
+                            (
+                                entry.path,
+                                stat_result.st_size,
+                                stat_result.st_mtime_ns,
+                                stat_result.st_ctime,
+                            )
+                        )
+
+                        # Update current file for UI
+                        if hass and len(video_files) % 10 == 0:  # Update every 10 files to reduce overhead
+                            hass.add_job(update_scan_state, hass, current_file=entry.path)
+        except (PermissionError, OSError) as err:
+            _LOGGER.warning("Error scanning directory %s: %s", root, err)
+
     return video_files
 
-async def hash_files_parallel(hass: HomeAssistant, files: List[str]) -> Dict[str, str]:
-    """Hash multiple files in parallel using a thread pool."""
+async def hash_files_parallel(
+    hass: HomeAssistant,
+    files: List[str],
+    hash_func=calculate_file_hash,
+) -> Dict[str, str]:
+    """Hash multiple files in parallel using the integration thread pool."""
     file_hashes = {}
-    
-    # Use a thread pool to hash files in parallel
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        # Create a list of future objects
-        future_to_file = {
-            executor.submit(calculate_file_hash, filepath): filepath
-            for filepath in files
-        }
-        
-        # Process results as they complete
-        for future in asyncio.as_completed([future for future in future_to_file]):
-            filepath = future_to_file[future]
-            try:
-                file_hash = future.result()
-                if file_hash:  # Only add if hash was successful
-                    file_hashes[filepath] = file_hash
-                    
-                    # Update scan state
-                    update_scan_state(hass, current_file=filepath)
-            except Exception as exc:
-                _LOGGER.error("Error processing file %s: %s", filepath, exc)
-    
+
+    # Submit in path order so files that live on the same mount (and
+    # often in the same directories) are read back-to-back; on
+    # HDD-backed shares this keeps the heads from ping-ponging between
+    # unrelated parts of the disk
+    files = sorted(files)
+
+    # Use the integration-owned thread pool (None falls through to the
+    # default executor). run_in_executor yields real asyncio futures;
+    # asyncio.as_completed can't consume concurrent.futures objects.
+    executor = hass.data.get(DOMAIN, {}).get("io_executor")
+
+    @callback
+    def _push_progress(_future) -> None:
+        # Runs in the event loop as each file finishes; pushes the
+        # workers' scan_state mutations (processed_files, current_file)
+        # to the entity. The dispatch throttle caps this at ~4/sec.
+        update_scan_state(hass)
+
+    tasks = []
+    for filepath in files:
+        task = hass.loop.run_in_executor(executor, hash_func, filepath)
+        task.add_done_callback(_push_progress)
+        tasks.append(task)
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    for filepath, result in zip(files, results):
+        if isinstance(result, BaseException):
+            _LOGGER.error("Error processing file %s: %s", filepath, result)
+        elif result:  # Only add if hash was successful
+            file_hashes[filepath] = result
+
     return file_hashes
 
+# Version and key for the persistent hash cache
+HASH_CACHE_VERSION = 1
+HASH_CACHE_KEY = f"{DOMAIN}_hash_cache"
+
+async def _async_get_hash_cache(hass: HomeAssistant) -> Dict[str, Any]:
+    """Load (or lazily create) the persistent path -> hash cache.
+
+    Entries are [size, mtime_ns, hash]; the whole cache is dropped when
+    the hash backend changes so stale digests can't mix in.
+    """
+    data = hass.data.setdefault(DOMAIN, {})
+    cache = data.get("hash_cache")
+    if cache is None:
+        store = data.get("hash_store")
+        if store is None:
+            store = Store(hass, HASH_CACHE_VERSION, HASH_CACHE_KEY)
+            data["hash_store"] = store
+        cache = await store.async_load() or {}
+        if cache.get("backend") != _new_hasher.__name__:
+            cache = {"backend": _new_hasher.__name__, "files": {}}
+        data["hash_cache"] = cache
+    return cache
+
 async def find_duplicate_videos(
     hass: HomeAssistant,
     video_extensions: List[str] = DEFAULT_VIDEO_EXTENSIONS,
@@ -290,37 +473,38 @@ async def find_duplicate_videos(
     _LOGGER.info("Starting duplicate video scan")
     
     try:
-        # Find video files in home directories
+        # Find video files in home directories; the root listing can't
+        # change mid-run, so memoize it for the duration of this scan
+        # (handle_find_duplicates clears it at the start of each run)
         all_videos = []
-        home_dirs = await hass.async_add_executor_job(get_home_directories)
+        home_dirs = hass.data[DOMAIN].get("root_dirs")
+        if home_dirs is None:
+            home_dirs = await hass.async_add_executor_job(get_home_directories)
+            hass.data[DOMAIN]["root_dirs"] = home_dirs
         _LOGGER.debug("Found home directories: %s", home_dirs)
         
-        for home_dir in home_dirs:
-            _LOGGER.info("Scanning directory: %s", home_dir)
-            
-            # Check if scan was cancelled
-            if scan_state["cancel_requested"]:
-                _LOGGER.info("Scan cancelled")
-                break
-                
-            # Wait if paused
-            await scan_state["pause_event"].wait()
-            
-            # Find video files
-            videos = await hass.async_add_executor_job(
+        # Walk all roots concurrently — they're independent and
+        # I/O-bound, so wall time shrinks to the slowest root. The
+        # walkers themselves honor pause/cancel internally.
+        _LOGGER.info("Scanning directories: %s", home_dirs)
+        results = await asyncio.gather(*(
+            hass.async_add_executor_job(
                 find_video_files, home_dir, video_extensions, hass
             )
+            for home_dir in home_dirs
+        ))
+        for home_dir, videos in zip(home_dirs, results):
             _LOGGER.debug("Found %d videos in %s", len(videos), home_dir)
-            
             all_videos.extend(videos)
-            
-            # Update total file count
-            scan_state["total_files"] = len(all_videos)
-            update_scan_state(hass, 
-                total_files=len(all_videos),
-                current_file=f"Found {len(all_videos)} video files so far..."
-            )
-            
+
+        # Update total file count
+        scan_state["total_files"] = len(all_videos)
+        update_scan_state(hass,
+            total_files=len(all_videos),
+            current_file=f"Found {len(all_videos)} video files..."
+        )
+
+
         # Check if scan was cancelled
         if scan_state["cancel_requested"]:
             _LOGGER.info("Scan cancelled after finding files")
@@ -329,40 +513,112 @@ async def find_duplicate_videos(
             
         # Calculate file hashes and find duplicates
         _LOGGER.info("Found %d video files, starting to hash files...", len(all_videos))
-        
-        # Update the scan state
-        update_scan_state(hass, 
-            total_files=len(all_videos),
-            current_file=f"Starting to hash {len(all_videos)} files..."
-        )
-        
+
         # Make sure we're still in scanning state before proceeding
         if not scan_state["is_scanning"]:
             _LOGGER.debug("Resetting scanning state to True")
             update_scan_state(hass, is_scanning=True)
-        
+
         # Process files
         duplicates = {}
+
+        # Stage 1: group by file size. A file whose size is unique can't
+        # have a duplicate, so it never needs to be read at all. Sizes
+        # were already collected during the walk, so no extra stat pass.
+        update_scan_state(hass,
+            current_file=f"Comparing sizes of {len(all_videos)} files..."
+        )
+        file_sizes = {path: size for path, size, _, _ in all_videos}
+        file_mtimes = {path: mtime for path, _, mtime, _ in all_videos}
+        file_ctimes = {path: ctime for path, _, _, ctime in all_videos}
+        size_groups: Dict[int, List[str]] = {}
+        for filepath, size, _, _ in all_videos:
+            size_groups.setdefault(size, []).append(filepath)
+        size_candidates = [
+            filepath
+            for group in size_groups.values()
+            if len(group) > 1
+            for filepath in group
+        ]
+        _LOGGER.info(
+            "%d of %d files share a size with another file",
+            len(size_candidates), len(all_videos)
+        )
+
+        # Check if scan was cancelled between stages
+        if scan_state["cancel_requested"]:
+            _LOGGER.info("Scan cancelled before partial hashing")
+            update_scan_state(hass, is_scanning=False)
+            return {}
+
+        # Stage 2: cheap head/tail partial hash within each size group
+        partial_hashes = await hash_files_parallel(
+            hass, size_candidates, hash_func=calculate_partial_hash
+        )
+        partial_groups: Dict[Tuple[int, str], List[str]] = {}
+        for filepath, partial in partial_hashes.items():
+            partial_groups.setdefault((file_sizes[filepath], partial), []).append(filepath)
+        full_candidates = [
+            filepath
+            for group in partial_groups.values()
+            if len(group) > 1
+            for filepath in group
+        ]
+
+        if scan_state["cancel_requested"]:
+            _LOGGER.info("Scan cancelled before full hashing")
+            update_scan_state(hass, is_scanning=False)
+            return {}
+
+        # Stage 3: full-content hash only for surviving candidates,
+        # reusing cached hashes for files unchanged since the last scan
+        cache = await _async_get_hash_cache(hass)
+        cached_files = cache["files"]
+
+        file_hashes: Dict[str, str] = {}
+        to_hash: List[str] = []
+        for filepath in full_candidates:
+            cached = cached_files.get(filepath)
+            if (
+                cached
+                and cached[0] == file_sizes[filepath]
+                and cached[1] == file_mtimes[filepath]
+            ):
+                file_hashes[filepath] = cached[2]
+            else:
+                to_hash.append(filepath)
+
+        scan_state["processed_files"] = 0
+        update_scan_state(hass,
+            total_files=len(to_hash),
+            processed_files=0,
+            current_file=f"Hashing {len(to_hash)} candidate files..."
+        )
+        _LOGGER.debug(
+            "Starting parallel file hashing (%d cached, %d to hash)",
+            len(file_hashes), len(to_hash)
+        )
+        new_hashes = await hash_files_parallel(hass, to_hash)
+        file_hashes.update(new_hashes)
+        _LOGGER.debug("Completed hashing %d files", len(new_hashes))
+
+        # Persist the newly computed hashes for the next scan
+        if new_hashes:
+            for filepath, file_hash in new_hashes.items():
+                cached_files[filepath] = [
+                    file_sizes[filepath], file_mtimes[filepath], file_hash
+                ]
+            await hass.data[DOMAIN]["hash_store"].async_save(cache)
         
-        # Hash all files in parallel
-        _LOGGER.debug("Starting parallel file hashing")
-        file_hashes = await hash_files_parallel(hass, all_videos)
-        _LOGGER.debug("Completed hashing %d files", len(file_hashes))
-        
-        # Group files by hash to find duplicates
+        # Group files by hash to find duplicates (setdefault does the
+        # lookup and insert in one step); size and ctime come from the
+        # walk's cached stats, so this loop issues no syscalls
         for filepath, file_hash in file_hashes.items():
-            if file_hash in duplicates:
-                duplicates[file_hash].append({
-                    "path": filepath,
-                    "size": os.path.getsize(filepath),
-                    "created": os.path.getctime(filepath)
-                })
-            else:
-                duplicates[file_hash] = [{
-                    "path": filepath,
-                    "size": os.path.getsize(filepath),
-                    "created": os.path.getctime(filepath)
-                }]
+            duplicates.setdefault(file_hash, []).append({
+                "path": filepath,
+                "size": file_sizes[filepath],
+                "created": file_ctimes[filepath]
+            })
         
         # Filter to only include actual duplicates (more than 1 file with same hash)
         result_duplicates = {k: v for k, v in duplicates.items() if len(v) > 1}
@@ -393,14 +649,22 @@ async def find_duplicate_videos(
 
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up the services for the Duplicate Video Finder integration."""
-    # Initialize the data dictionary
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN]["duplicates"] = {}
-    hass.data[DOMAIN]["scan_state"] = scan_state
-    hass.data[DOMAIN].setdefault("entities", [])
+    # Initialize the data dictionary without wiping existing entries
+    data = hass.data.setdefault(DOMAIN, {})
+
+    # On reload everything below is already wired up; re-running it
+    # would replace the pause_event a running scan's workers are
+    # blocked on, stranding them forever
+    if data.get("services_registered"):
+        return True
+
+    data.setdefault("duplicates", {})
+    data["scan_state"] = scan_state
+    data.setdefault("entities", set())
     
-    # Initialize the pause event
-    scan_state["pause_event"] = asyncio.Event()
+    # Initialize the pause event (kept across reloads once created)
+    if scan_state["pause_event"] is None:
+        scan_state["pause_event"] = asyncio.Event()
     scan_state["pause_event"].set()  # Not paused initially
     
     # Make sure the initial scan state is propagated
@@ -429,6 +693,10 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         scan_state["pause_time"] = None
         scan_state["total_pause_time"] = 0
         scan_state["found_duplicates"] = {}
+
+        # Drop the memoized root listing so directories created since
+        # the previous scan are picked up; it is re-cached for this run
+        hass.data[DOMAIN].pop("root_dirs", None)
         
         # Update state immediately - this ensures the entity reflects our scanning state
         update_scan_state(hass)
@@ -569,6 +837,22 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             _LOGGER.error("Error creating test files: %s", err)
             raise
 
+    @websocket_api.websocket_command(
+        {vol.Required("type"): f"{DOMAIN}/list_duplicates"}
+    )
+    @callback
+    def websocket_list_duplicates(
+        hass: HomeAssistant, connection, msg: Dict[str, Any]
+    ) -> None:
+        """Return the full duplicates dict on demand.
+
+        Served over the WebSocket so the sensor doesn't have to embed a
+        potentially huge dict in its state attributes.
+        """
+        connection.send_result(msg["id"], scan_state.get("found_duplicates", {}))
+
+    websocket_api.async_register_command(hass, websocket_list_duplicates)
+
     # Register all services
     hass.services.async_register(
         DOMAIN, SERVICE_FIND_DUPLICATES, handle_find_duplicates
@@ -590,6 +874,8 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         DOMAIN, "create_test_files", handle_create_test_files
     )
     
+    data["services_registered"] = True
+
     # Log all the registered services for debugging
     _LOGGER.info("Registered services: %s", hass.services.async_services().get(DOMAIN, {}))
     
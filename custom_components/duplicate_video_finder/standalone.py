@@ -5,6 +5,11 @@ import argparse
 import json
 from typing import Dict, List, Set
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def calculate_file_hash(filepath: str, chunk_size: int = 8192) -> str:
     """Calculate SHA-256 hash of a file."""
     try:
@@ -99,9 +104,13 @@ def main():
     
     duplicates = find_duplicate_videos(args.directories, args.extensions, excluded_dirs)
     
-    # Save results to file
-    with open(args.output, "w") as f:
-        json.dump(duplicates, f, indent=2)
+    # Save results to file (orjson serializes in C when installed)
+    if orjson is not None:
+        with open(args.output, "wb") as f:
+            f.write(orjson.dumps(duplicates, option=orjson.OPT_INDENT_2))
+    else:
+        with open(args.output, "w") as f:
+            json.dump(duplicates, f, indent=2)
     
     print(f"Results saved to {args.output}")
     
@@ -1,72 +1,127 @@
 """Test the Duplicate Video Finder integration."""
+import asyncio
 import os
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 
+from custom_components.duplicate_video_finder import services
+from custom_components.duplicate_video_finder.const import DOMAIN
 from custom_components.duplicate_video_finder.services import (
     calculate_file_hash,
     is_excluded_directory,
     find_duplicate_videos,
 )
 
-@pytest.fixture
-def mock_hass():
-    """Create a mock hass object."""
+def _make_hass():
+    """Create a hass stub whose executor hooks really run the callables."""
     hass = MagicMock()
+    hass.loop = asyncio.get_running_loop()
+    hass.data = {DOMAIN: {}}
+    hass.async_add_executor_job = lambda func, *args: hass.loop.run_in_executor(
+        None, func, *args
+    )
+    hass.add_job = lambda func, *args, **kwargs: func(*args, **kwargs)
     return hass
 
-def test_calculate_file_hash(tmp_path):
+@pytest.fixture(scope="session")
+def hash_corpus(tmp_path_factory):
+    """Create the hash-test files once for the whole session."""
+    corpus_dir = tmp_path_factory.mktemp("hash_corpus")
+    files = {}
+    for name, content in (
+        ("short.txt", "test content"),
+        ("empty.txt", ""),
+        ("binary.bin", "\x00\x01" * 4096),
+    ):
+        path = corpus_dir / name
+        path.write_text(content)
+        files[name] = str(path)
+    return files
+
+@pytest.mark.parametrize("name", ["short.txt", "empty.txt", "binary.bin"])
+def test_calculate_file_hash(hash_corpus, name):
     """Test file hash calculation."""
-    # Create a test file with known content
-    test_file = tmp_path / "test.txt"
-    test_file.write_text("test content")
-    
-    # Calculate hash
-    hash_value = calculate_file_hash(str(test_file))
+    hash_value = calculate_file_hash(hash_corpus[name])
     
     # Verify hash is not empty and is a valid hex string
+    # (32 chars for xxh3_128, 64 for the SHA-256 fallback)
     assert hash_value
-    assert len(hash_value) == 64
+    assert len(hash_value) in (32, 64)
     assert all(c in '0123456789abcdef' for c in hash_value)
 
-def test_is_excluded_directory():
+def test_calculate_file_hash_distinct(hash_corpus):
+    """Different contents must produce different hashes."""
+    hashes = {calculate_file_hash(path) for path in hash_corpus.values()}
+    assert len(hashes) == len(hash_corpus)
+
+@pytest.mark.parametrize(
+    ("path", "excluded"),
+    [
+        ("/proc/something", True),
+        ("/sys/class", True),
+        ("/dev/sda1", True),
+        ("/home/user/videos", False),
+        ("/media/storage", False),
+        ("/mnt/external", False),
+    ],
+)
+def test_is_excluded_directory(path, excluded):
     """Test directory exclusion logic."""
-    # Test excluded directories
-    assert is_excluded_directory("/proc/something")
-    assert is_excluded_directory("/sys/class")
-    assert is_excluded_directory("/dev/sda1")
-    
-    # Test non-excluded directories
-    assert not is_excluded_directory("/home/user/videos")
-    assert not is_excluded_directory("/media/storage")
-    assert not is_excluded_directory("/mnt/external")
+    assert is_excluded_directory(path) is excluded
 
+@pytest.mark.parametrize(
+    ("contents", "expected_groups"),
+    [
+        # Two identical files and one different -> one group of two
+        (
+            {"video1.mp4": "test content", "video2.mp4": "test content",
+             "video3.mp4": "different content"},
+            [{"video1.mp4", "video2.mp4"}],
+        ),
+        # Three-way duplicate -> one group of three
+        (
+            {"a.mp4": "same", "b.mp4": "same", "c.mp4": "same"},
+            [{"a.mp4", "b.mp4", "c.mp4"}],
+        ),
+        # Same size but different content -> no duplicates
+        (
+            {"one.mp4": "aaa", "two.mp4": "bbb"},
+            [],
+        ),
+    ],
+)
 @pytest.mark.asyncio
-async def test_find_duplicate_videos(mock_hass, tmp_path):
-    """Test duplicate video finding functionality."""
-    # Create test directories and files
+async def test_find_duplicate_videos(tmp_path, contents, expected_groups):
+    """Test the full scan pipeline end to end."""
     test_dir = tmp_path / "test_videos"
     test_dir.mkdir()
-    
-    # Create two identical files
-    file1 = test_dir / "video1.mp4"
-    file2 = test_dir / "video2.mp4"
-    file1.write_text("test content")
-    file2.write_text("test content")
-    
-    # Create a different file
-    file3 = test_dir / "video3.mp4"
-    file3.write_text("different content")
-    
-    # Mock the get_accessible_directories function
-    with patch('custom_components.duplicate_video_finder.services.get_accessible_directories') as mock_get_dirs:
-        mock_get_dirs.return_value = [str(test_dir)]
-        
-        # Find duplicates
-        duplicates = await find_duplicate_videos(mock_hass)
-        
-        # Verify results
-        assert len(duplicates) == 1  # One group of duplicates
-        assert len(duplicates[list(duplicates.keys())[0]]) == 2  # Two files in the group
-        assert str(file1) in duplicates[list(duplicates.keys())[0]]
-        assert str(file2) in duplicates[list(duplicates.keys())[0]] 
\ No newline at end of file
+    for name, content in contents.items():
+        (test_dir / name).write_text(content)
+
+    hass = _make_hass()
+
+    # Make sure a previous test's scan state can't bleed in
+    services.scan_state["cancel_requested"] = False
+    services.scan_state["is_paused"] = False
+    services.scan_state["found_duplicates"] = {}
+
+    store = MagicMock()
+    store.async_load = AsyncMock(return_value=None)
+    store.async_save = AsyncMock()
+    with patch.object(
+        services, "get_home_directories", return_value=[str(test_dir)]
+    ), patch.object(services, "async_dispatcher_send"), patch.object(
+        services, "Store", return_value=store
+    ):
+        duplicates = await find_duplicate_videos(hass)
+
+    found = {
+        frozenset(os.path.basename(item["path"]) for item in group)
+        for group in duplicates.values()
+    }
+    assert found == {frozenset(names) for names in expected_groups}
+
+    # Every reported entry carries the real size from the walk's stats
+    for group in duplicates.values():
+        for item in group:
+            assert item["size"] == os.path.getsize(item["path"])
\ No newline at end of file